@@ -15,9 +15,15 @@ which is compatible with the built-in File.
 """
 
 # standard imports
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import io
 import logging
+import os
 import sys
+import threading
+import time
 import uuid
 import json
 
@@ -25,7 +31,7 @@ import json
 from .exceptions import DatalakeBadOffsetException, DatalakeIncompleteTransferException
 from .exceptions import FileNotFoundError, PermissionError
 from .lib import DatalakeRESTInterface
-from .utils import ensure_writable, read_block
+from .utils import commonprefix, ensure_writable, read_block
 from .enums import ExpiryOptionType
 from .retry import ExponentialRetryPolicy, NoRetryPolicy
 from .multiprocessor import multi_processor_change_acl
@@ -56,16 +62,40 @@ class AzureDLFileSystem(object):
         The API version to target with requests. Changing this value will change the behavior of the requests, and can cause unexpected behavior or breaking changes. Changes to this value should be undergone with caution.
     per_call_timeout_seconds: float(60)
         This is the timeout for each requests library call.
+    cache_ttl: float (None)
+        Seconds a cached directory listing stays valid before it is
+        re-fetched from the service. None (the default) keeps the existing
+        behavior of caching listings until they are explicitly invalidated.
+    listing_cache_size: int (None)
+        Maximum number of directory listings held in the cache; the least
+        recently used listings are evicted beyond this. None (the default)
+        leaves the cache unbounded, which suits short-lived processes but
+        can grow without limit during long walk-heavy workloads.
     kwargs: optional key/values
         Other arguments forwarded to the DatalakeRESTInterface constructor.
     """
     _singleton = [None]
+    # LRU of shared REST interfaces; each holds a connection pool, so the
+    # cache is bounded rather than growing with every distinct store seen.
+    _conn_cache = OrderedDict()
+    _CONN_CACHE_SIZE = 32
 
-    def __init__(self, token_credential=None, **kwargs):
+    def __init__(self, token_credential=None, cache_ttl=None,
+                 listing_cache_size=None, **kwargs):
         self.token_credential = token_credential
         self.kwargs = kwargs
+        self.cache_ttl = cache_ttl
+        self.listing_cache_size = listing_cache_size
         self.connect()
-        self.dirs = {}
+        # ordered so the oldest listings can be evicted when a size cap is
+        # set; without one, listings live until explicitly invalidated
+        self.dirs = OrderedDict()
+        # wall-clock stamp of when each cached listing was fetched; only
+        # consulted when cache_ttl is set
+        self._dirs_stamp = {}
+        # per-directory {name: entry} view of self.dirs, so info() resolves
+        # a child without scanning the listing
+        self._dirs_index = {}
         self._emptyDirs = []
         AzureDLFileSystem._singleton[0] = self
 
@@ -81,15 +111,40 @@ class AzureDLFileSystem(object):
     def connect(self):
         """
         Establish connection object.
+
+        Interfaces are shared between filesystems built with the same
+        credential and parameters, so pooled HTTP connections and any
+        still-valid cached token are reused instead of re-acquired.
         """
-        self.azure = DatalakeRESTInterface(token_credential=self.token_credential, **self.kwargs)
+        try:
+            key = (id(self.token_credential),
+                   tuple(sorted(self.kwargs.items())))
+            azure = AzureDLFileSystem._conn_cache.get(key)
+        except TypeError:
+            # unhashable parameter values; fall back to a private interface
+            key = None
+            azure = None
+        if azure is None:
+            azure = DatalakeRESTInterface(token_credential=self.token_credential, **self.kwargs)
+            if key is not None:
+                cache = AzureDLFileSystem._conn_cache
+                cache[key] = azure
+                while len(cache) > AzureDLFileSystem._CONN_CACHE_SIZE:
+                    cache.popitem(last=False)
+        else:
+            AzureDLFileSystem._conn_cache.move_to_end(key)
+        self.azure = azure
         self.token_credential = self.azure.token_credential
 
     def __setstate__(self, state):
         self.__dict__.update(state)
-        self.connect()
+        # The restored interface keeps its cached token; only rebuild when
+        # it did not survive pickling.
+        if getattr(self, 'azure', None) is None:
+            self.connect()
 
-    def open(self, path, mode='rb', blocksize=2 ** 25, delimiter=None):
+    def open(self, path, mode='rb', blocksize=2 ** 25, delimiter=None,
+             max_concurrency=None, readahead=False):
         """ Open a file for reading or writing
 
         Parameters
@@ -102,12 +157,21 @@ class AzureDLFileSystem(object):
             Size of data-node blocks if reading
         delimiter: byte(s) or None
             For writing delimiter-ended blocks
+        max_concurrency: int or None
+            Number of parallel range requests used to fill the read-ahead
+            buffer. None picks a default based on CPU count; 1 disables
+            parallel fetching.
+        readahead: bool (False)
+            Prefetch the next block in the background once a sequential
+            reader crosses the midpoint of the current one. Worthwhile for
+            front-to-back reads; wasted bandwidth on random access.
         """
         if 'b' not in mode:
             raise NotImplementedError("Text mode not supported, use mode='%s'"
                                       " and manage bytes" % (mode[0] + 'b'))
         return AzureDLFile(self, AzureDLPath(path), mode, blocksize=blocksize,
-                           delimiter=delimiter)
+                           delimiter=delimiter, max_concurrency=max_concurrency,
+                           readahead=readahead)
 
     def _ls_batched(self, path, batch_size=4000):
         """Batched ListStatus calls. Internal Method"""
@@ -135,11 +199,30 @@ class AzureDLFileSystem(object):
 
         if invalidate_cache:
             self.invalidate_cache(key)
+        elif (self.cache_ttl is not None and key in self.dirs
+                and time.time() - self._dirs_stamp.get(key, 0) > self.cache_ttl):
+            # entry outlived its TTL; re-fetch rather than serve stale data
+            self.dirs.pop(key, None)
 
         if key not in self.dirs:
-            self.dirs[key] = self._ls_batched(key, batch_size=batch_size)
-            for f in self.dirs[key]:
-                f['name'] = (path / f['pathSuffix']).as_posix()
+            listing = self._ls_batched(key, batch_size=batch_size)
+            # One plain string concat per entry; constructing an AzureDLPath
+            # per file is pathlib overhead multiplied by the listing size.
+            prefix = '' if key == '.' else key + '/'
+            for f in listing:
+                suffix = f['pathSuffix']
+                f['name'] = prefix + suffix if suffix else key
+            self.dirs[key] = listing
+            self._dirs_index[key] = {f['name']: f for f in listing}
+            self._dirs_stamp[key] = time.time()
+            if self.listing_cache_size:
+                while len(self.dirs) > self.listing_cache_size:
+                    old, _ = self.dirs.popitem(last=False)
+                    self._dirs_index.pop(old, None)
+                    self._dirs_stamp.pop(old, None)
+        else:
+            # refresh recency so hot directories survive eviction
+            self.dirs.move_to_end(key)
         return self.dirs[key]
 
     def ls(self, path="", detail=False, invalidate_cache=True):
@@ -207,25 +290,32 @@ class AzureDLFileSystem(object):
             if path_as_posix not in {'/', '.'}:
                 if root_as_posix not in self.dirs:
                     self.dirs[root_as_posix] = [to_return]
+                    self._dirs_index[root_as_posix] = {path_as_posix: to_return}
                 else:
-                    found = False
-                    for f in self.dirs[root_as_posix]:
-                        if f['name'] == path_as_posix:
-                            found = True
-                            break
-                    if not found:
+                    index = self._dirs_index.setdefault(
+                        root_as_posix,
+                        {f['name']: f for f in self.dirs[root_as_posix]})
+                    if path_as_posix not in index:
                         self.dirs[root_as_posix].append(to_return)
+                        index[path_as_posix] = to_return
             return to_return
 
-        for f in self._ls(root, invalidate_cache):
-            if f['name'] == path_as_posix:
-                return f
+        self._ls(root, invalidate_cache)
+        found = self._dirs_index.get(root_as_posix, {}).get(path_as_posix)
+        if found is not None:
+            return found
 
         raise FileNotFoundError(path)
 
-    def _walk(self, path, invalidate_cache=True, include_dirs=False):
+    def _iter_walk(self, path, invalidate_cache=True, include_dirs=False):
         """
-        Walk a path recursively and returns list of files and dirs(if parameter set)
+        Walk a path recursively, yielding files (and dirs, if requested)
+        as they are discovered
+
+        Peak memory stays proportional to the widest level of the tree
+        rather than the total file count, and consumers see the first
+        entries before the walk finishes. ``self._emptyDirs`` is only
+        complete once the generator is exhausted.
 
         Parameters
         ----------
@@ -234,35 +324,72 @@ class AzureDLFileSystem(object):
         invalidate_cache: bool
             Whether to invalidate cache
         include_dirs: bool
-            Whether to include dirs in return value
+            Whether to include dirs in yielded values
 
-        Returns
-        -------
-        List of files and (optionally) dirs
+        Yields
+        ------
+        File and (optionally) dir info dicts
         """
-        ret = list(self._ls(path, invalidate_cache))
         self._emptyDirs = []
-        current_subdirs = [f for f in ret if f['type'] != 'FILE']
+
+        def list_one(apath):
+            try:
+                return self._ls(apath['name'], invalidate_cache)
+            except FileNotFoundError:
+                # Folder may have been deleted while walk is going on. Infrequent so we can take the linear hit
+                return None
+
+        current_subdirs = []
+        for f in self._ls(path, invalidate_cache):
+            if f['type'] == 'FILE':
+                yield f
+            else:
+                current_subdirs.append(f)
         while current_subdirs:
+            # Each level's directories are independent; listing them
+            # concurrently bounds the wall clock by tree depth rather
+            # than directory count. The shared process pool means repeated
+            # walks do not pay thread startup per call.
+            if len(current_subdirs) > 1:
+                listings = list(_list_pool().map(list_one, current_subdirs))
+            else:
+                listings = [list_one(current_subdirs[0])]
             dirs_below_current_level = []
-            for apath in current_subdirs:
-                try:
-                    sub_elements = self._ls(apath['name'], invalidate_cache)
-                except FileNotFoundError:
-                    # Folder may have been deleted while walk is going on. Infrequent so we can take the linear hit
-                    ret.remove(apath)
+            for apath, sub_elements in zip(current_subdirs, listings):
+                if sub_elements is None:
+                    # vanished mid-walk; yielding dirs only after their
+                    # listing succeeds means it never surfaces at all
                     continue
+                if include_dirs:
+                    yield apath
                 if not sub_elements:
                     self._emptyDirs.append(apath)
-                else:
-                    ret.extend(sub_elements)
-                    dirs_below_current_level.extend([f for f in sub_elements if f['type'] != 'FILE'])
+                    continue
+                for f in sub_elements:
+                    if f['type'] == 'FILE':
+                        yield f
+                    else:
+                        dirs_below_current_level.append(f)
             current_subdirs = dirs_below_current_level
 
-        if include_dirs:
-            return ret
-        else:
-            return [f for f in ret if f['type'] == 'FILE']
+    def _walk(self, path, invalidate_cache=True, include_dirs=False):
+        """
+        Walk a path recursively and returns list of files and dirs(if parameter set)
+
+        Parameters
+        ----------
+        path: str or AzureDLPath
+            Path to query
+        invalidate_cache: bool
+            Whether to invalidate cache
+        include_dirs: bool
+            Whether to include dirs in return value
+
+        Returns
+        -------
+        List of files and (optionally) dirs
+        """
+        return list(self._iter_walk(path, invalidate_cache, include_dirs))
 
     def _empty_dirs_to_add(self):
         """ Returns directories found empty during walk. Only for internal use"""
@@ -291,6 +418,17 @@ class AzureDLFileSystem(object):
         """
         Find files (not directories) by glob-matching.
 
+        Each pattern segment applies to one path segment (``**`` is not
+        recursive). A pattern with no literal directory head, such as
+        ``'*.csv'``, follows ``pathlib.PurePath.match`` semantics and
+        matches from the right, at any depth. A pattern with a literal
+        head, such as ``'data/*.csv'``, is anchored at that head: one
+        pattern segment per path level below it, and only the directories
+        that can still produce a match are listed rather than walking the
+        whole subtree. Earlier releases matched every pattern from the
+        right, so ``'data/*.csv'`` also matched files in any deeper
+        directory named ``data``; anchored patterns no longer do.
+
         Parameters
         ----------
         path: str or AzureDLPath
@@ -308,10 +446,121 @@ class AzureDLFileSystem(object):
         path = AzureDLPath(path).trim()
         path_as_posix = path.as_posix()
         prefix = path.globless_prefix
-        allfiles = self.walk(prefix, details, invalidate_cache)
         if prefix == path:
-            return allfiles
-        return [f for f in allfiles if AzureDLPath(f['name'] if details else f).match(path_as_posix)]
+            return self.walk(prefix, details, invalidate_cache)
+        if prefix.as_posix() == '.':
+            # No literal head to descend from; patterns like '*.csv' match
+            # as a path suffix at any depth, which needs the full walk.
+            if (path_as_posix.startswith('*') and
+                    not any(c in path_as_posix[1:] for c in '*?[/')):
+                # pure-suffix pattern; str.endswith beats a matcher call
+                # per name, and a segment match is equivalent here since
+                # the suffix cannot span a '/'
+                suffix = path_as_posix[1:]
+                return [f if details else f['name']
+                        for f in self._iter_walk(prefix, invalidate_cache)
+                        if f['name'].endswith(suffix)]
+            match = _glob_matcher(path_as_posix)
+            return [f if details else f['name']
+                    for f in self._iter_walk(prefix, invalidate_cache)
+                    if match(f['name'])]
+
+        # Literal head: descend segment by segment, listing only the
+        # directories that can still lead to a match instead of walking
+        # every descendant of the prefix.
+        tail = pathlib.PurePath(path_as_posix).parts[len(prefix.parts):]
+        matchers = [_compile_part(seg) for seg in tail]
+
+        def list_one(dirpath):
+            try:
+                return self._ls(dirpath, invalidate_cache)
+            except FileNotFoundError:
+                return []
+
+        out = []
+        level = [prefix.as_posix()]
+        for depth, m in enumerate(matchers):
+            last = depth == len(matchers) - 1
+            if not level:
+                break
+            if depth == 0:
+                # the first listing reports a missing prefix, like walk did
+                listings = [self._ls(level[0], invalidate_cache)]
+            elif len(level) > 1:
+                listings = list(_list_pool().map(list_one, level))
+            else:
+                listings = [list_one(level[0])]
+            next_level = []
+            for dirpath, entries in zip(level, listings):
+                for f in entries:
+                    name = f['name']
+                    if name == dirpath:
+                        # listing a file returns the file itself; it is not
+                        # a child and cannot extend the pattern
+                        continue
+                    if not m(name.rsplit('/', 1)[-1]):
+                        continue
+                    if last:
+                        if f['type'] == 'FILE':
+                            out.append(f if details else name)
+                    elif f['type'] != 'FILE':
+                        next_level.append(name)
+            level = next_level
+        return out
+
+    def glob_many(self, paths, details=False, invalidate_cache=True):
+        """
+        Find files matching any of several glob patterns in a single walk
+
+        Globbing P patterns separately walks overlapping subtrees P times;
+        here one traversal of the patterns' common prefix serves them all,
+        testing each name against every pattern's matcher. Results are
+        de-duplicated and matching follows the same semantics as ``glob``.
+
+        Parameters
+        ----------
+        paths: iterable of str or AzureDLPath
+            Patterns to query
+        details: bool
+            Whether to include file details
+        invalidate_cache: bool
+            Whether to invalidate cache
+
+        Returns
+        -------
+        List of files matching at least one pattern
+        """
+        prefixes = []
+        matchers = []
+        for p in paths:
+            p = AzureDLPath(p).trim()
+            prefix = p.globless_prefix
+            prefix_posix = prefix.as_posix()
+            prefixes.append(prefix_posix)
+            if prefix == p:
+                # glob-less pattern; glob walks the whole subtree, so every
+                # file at or below the literal path matches
+                matchers.append(
+                    lambda name, pre=prefix_posix:
+                    name == pre or name.startswith(pre + '/'))
+            elif prefix_posix == '.':
+                # headless pattern: right-anchored, as in glob
+                matchers.append(_glob_matcher(p.as_posix()))
+            else:
+                # literal head: anchored segment-by-segment, as in glob
+                tail = pathlib.PurePath(p.as_posix()).parts[len(prefix.parts):]
+                matchers.append(_anchored_matcher(prefix_posix, tail))
+        if not matchers:
+            return []
+        root = prefixes[0] if len(set(prefixes)) == 1 else \
+            commonprefix(prefixes)
+
+        def hit(name):
+            return any(match(name) for match in matchers)
+
+        return [f if details else f['name']
+                for f in self._iter_walk(root, invalidate_cache)
+                if hit(f['name'])]
 
     def du(self, path, total=False, deep=False, invalidate_cache=True):
         """
@@ -334,7 +583,8 @@ class AzureDLFileSystem(object):
         """
 
         if deep:
-            files = self._walk(path, invalidate_cache)
+            # consume the walk lazily; no need to hold every entry at once
+            files = self._iter_walk(path, invalidate_cache)
         else:
             files = self.ls(path, detail=True, invalidate_cache=invalidate_cache)
         if total:
@@ -356,7 +606,7 @@ class AzureDLFileSystem(object):
             return {'directoryCount': 0, 'fileCount': 1, 'length': current_path_info['length'], 'quota': -1,
                     'spaceConsumed': current_path_info['length'], 'spaceQuota': -1}
         else:
-            all_files_and_dirs = self._walk(path, include_dirs=True)
+            all_files_and_dirs = self._iter_walk(path, include_dirs=True)
             dir_count = 1  # 1 as walk doesn't return current directory
             length = file_count = 0
             for item in all_files_and_dirs:
@@ -646,11 +896,12 @@ class AzureDLFileSystem(object):
         -------
         Last(size) bytes of file
         """
-        length = self.info(path)['length']
-        if size > length:
-            return self.cat(path)
+        # the open itself stats the file, so reuse f.size instead of paying
+        # a separate info round trip
         with self.open(path, 'rb') as f:
-            f.seek(length - size)
+            if size > f.size:
+                return f.read()
+            f.seek(f.size - size)
             return f.read(size)
 
     def head(self, path, size=1024):
@@ -686,13 +937,35 @@ class AzureDLFileSystem(object):
         -------
         None
         """
-        with self.open(path, 'rb') as f:
-            with open(filename, 'wb') as f2:
-                while True:
-                    data = f.read(f.blocksize)
-                    if len(data) == 0:
-                        break
-                    f2.write(data)
+        # get() always reads front to back, the case readahead is built for
+        with self.open(path, 'rb', readahead=True) as f:
+            # A wide local buffer keeps disk writes from being issued one
+            # small syscall at a time.
+            with open(filename, 'wb', buffering=2 ** 20) as f2:
+                if f.size and hasattr(os, 'posix_fallocate'):
+                    try:
+                        # Reserve the extents up front so the file grows in
+                        # one metadata update instead of once per write.
+                        os.posix_fallocate(f2.fileno(), 0, f.size)
+                    except OSError:
+                        # Not supported by this filesystem; plain writes work.
+                        pass
+                # Double-buffer: pull the next remote block while the
+                # current one is written to disk, so network and disk time
+                # overlap instead of adding up. The two bytearrays are
+                # recycled for the whole transfer, so no per-block bytes
+                # object is allocated.
+                with ThreadPoolExecutor(1) as reader:
+                    bufs = [bytearray(f.blocksize), bytearray(f.blocksize)]
+                    current = 0
+                    future = reader.submit(f.readinto, bufs[current])
+                    while True:
+                        nbytes = future.result()
+                        if nbytes == 0:
+                            break
+                        current = 1 - current
+                        future = reader.submit(f.readinto, bufs[current])
+                        f2.write(memoryview(bufs[1 - current])[:nbytes])
 
     def put(self, filename, path, delimiter=None):
         """
@@ -711,13 +984,23 @@ class AzureDLFileSystem(object):
         -------
         None
         """
-        with open(filename, 'rb') as f:
+        with open(filename, 'rb', buffering=2 ** 20) as f:
             with self.open(path, 'wb', delimiter=delimiter) as f2:
-                while True:
-                    data = f.read(f2.blocksize)
-                    if len(data) == 0:
-                        break
-                    f2.write(data)
+                # Mirror of get(): read the next disk block while the
+                # current one is on the wire, into recycled buffers.
+                # write() copies the chunk before queueing it, so the
+                # buffer can be refilled immediately.
+                with ThreadPoolExecutor(1) as reader:
+                    bufs = [bytearray(f2.blocksize), bytearray(f2.blocksize)]
+                    current = 0
+                    future = reader.submit(f.readinto, bufs[current])
+                    while True:
+                        nbytes = future.result()
+                        if nbytes == 0:
+                            break
+                        current = 1 - current
+                        future = reader.submit(f.readinto, bufs[current])
+                        f2.write(memoryview(bufs[1 - current])[:nbytes])
 
     def mkdir(self, path):
         """
@@ -755,7 +1038,11 @@ class AzureDLFileSystem(object):
         # should always invalidate the cache when checking to see if the directory is empty
         if self.ls(path, invalidate_cache=True):
             raise ValueError('Directory not empty: %s' % path)
-        self.rm(path, False)
+        # the listing above just proved the directory exists; delete it
+        # directly rather than paying rm()'s existence probe again
+        path = AzureDLPath(path).trim()
+        self.azure.call('DELETE', path.as_posix(), recursive=False)
+        self.invalidate_cache(path)
 
     def mv(self, path1, path2):
         """
@@ -835,14 +1122,33 @@ class AzureDLFileSystem(object):
         None
         """
         path = AzureDLPath(path).trim()
-        # Always invalidate the cache when attempting to check existence of something to delete
+        # Always invalidate the cache when attempting to check existence of something to delete.
+        # The probe cannot be folded into DELETE: WebHDFS DELETE is
+        # idempotent and reports success for a missing path, so this is the
+        # only way to surface FileNotFoundError.
         if not self.exists(path, invalidate_cache=True):
             raise FileNotFoundError(path)
         self.azure.call('DELETE', path.as_posix(), recursive=recursive)
+        key = path.as_posix()
         self.invalidate_cache(path)
         if recursive:
-            matches = [p for p in self.dirs if p.startswith(path.as_posix())]
-            [self.invalidate_cache(m) for m in matches]
+            if key == '.':
+                self.dirs.clear()
+                self._dirs_index.clear()
+            else:
+                # Rebuild the cache in one pass instead of popping each
+                # descendant (and its parent) individually; the trailing '/'
+                # keeps a delete of 'a' from evicting the sibling 'ab'.
+                # Iterate over snapshots: list() completes atomically, while
+                # consuming the dicts directly raises RuntimeError if another
+                # thread pops an entry mid-rebuild.
+                prefix = key + '/'
+                self.dirs = OrderedDict(
+                    (p, f) for p, f in list(self.dirs.items())
+                    if not p.startswith(prefix))
+                self._dirs_index = {p: f
+                                    for p, f in list(self._dirs_index.items())
+                                    if not p.startswith(prefix)}
 
     def invalidate_cache(self, path=None):
         """
@@ -859,11 +1165,17 @@ class AzureDLFileSystem(object):
         """
         if path is None:
             self.dirs.clear()
+            self._dirs_index.clear()
+            self._dirs_stamp.clear()
         else:
             path = AzureDLPath(path).trim()
             self.dirs.pop(path.as_posix(), None)
+            self._dirs_index.pop(path.as_posix(), None)
+            self._dirs_stamp.pop(path.as_posix(), None)
             parent = AzureDLPath(path.parent).trim()
             self.dirs.pop(parent.as_posix(), None)
+            self._dirs_index.pop(parent.as_posix(), None)
+            self._dirs_stamp.pop(parent.as_posix(), None)
 
     def touch(self, path):
         """
@@ -919,7 +1231,7 @@ class AzureDLFileSystem(object):
         distributed.utils.read_block
         """
         with self.open(fn, 'rb') as f:
-            size = f.info()['length']
+            size = f.size
             if offset >= size:
                 return b''
             if length is None:
@@ -954,6 +1266,12 @@ class AzureDLFile(object):
         If specified and in write mode, each flush will send data terminating
         on this bytestring, potentially leaving some data in the buffer.
 
+    In write and append modes, full blocks are uploaded by a background
+    worker while the caller keeps filling the next buffer, so sequential
+    writes overlap with the APPEND requests on the wire. A single worker
+    preserves the strict offset ordering the service requires, and at most
+    a few blocks are queued at a time to bound memory.
+
     Examples
     --------
     >>> adl = AzureDLFileSystem()  # doctest: +SKIP
@@ -966,13 +1284,14 @@ class AzureDLFile(object):
     """
 
     def __init__(self, azure, path, mode='rb', blocksize=2 ** 25,
-                 delimiter=None):
+                 delimiter=None, max_concurrency=None, readahead=False):
         self.mode = mode
         if mode not in {'rb', 'wb', 'ab'}:
             raise NotImplementedError("File mode must be {'rb', 'wb', 'ab'}, not %s" % mode)
         self.path = path
         self.azure = azure
         self.cache = b""
+        self._cache_mv = memoryview(b"")
         self.loc = 0
         self.delimiter = delimiter
         self.start = 0
@@ -981,6 +1300,12 @@ class AzureDLFile(object):
         self.trim = True
         self.buffer = io.BytesIO()
         self.blocksize = blocksize
+        if max_concurrency is None:
+            max_concurrency = min(16, (os.cpu_count() or 1) * 2)
+        self.max_concurrency = max(1, max_concurrency)
+        self.readahead = readahead
+        # (start, end, future) of a block being prefetched, or None
+        self._ahead = None
         uniqueid = str(uuid.uuid4())
         self.filesessionid = uniqueid
         self.leaseid = uniqueid
@@ -991,7 +1316,11 @@ class AzureDLFile(object):
             file_data = self.azure.info(path, invalidate_cache=True, expected_error_code=404)
             exists = True
         except FileNotFoundError:
+            file_data = None
             exists = False
+        # metadata fetched by the open itself; info() reuses it rather than
+        # paying another round trip per call
+        self._info = file_data
 
         # cannot create a new file object out of a directory
         if exists and file_data['type'] == 'DIRECTORY':
@@ -1000,6 +1329,12 @@ class AzureDLFile(object):
 
         if mode == 'ab' or mode == 'wb':
             self.blocksize = min(2 ** 22, blocksize)
+            # Full-block appends are handed to a single background worker so
+            # the caller can fill the next buffer while the previous block
+            # is on the wire. One worker keeps the strict offset ordering
+            # that the APPEND op requires.
+            self._writer = ThreadPoolExecutor(1)
+            self._pending = deque()
 
         if mode == 'ab' and exists:
             self.loc = file_data['length']
@@ -1022,8 +1357,16 @@ class AzureDLFile(object):
             self.size = file_data['length']
 
     def info(self):
-        """ File information about this path """
-        return self.azure.info(self.path)
+        """ File information about this path
+
+        Read mode serves the metadata captured when the file was opened;
+        the handle pins that view of the file anyway. Write modes re-fetch,
+        since the length moves with every append.
+        """
+        if self.mode == 'rb' and self._info is not None:
+            return self._info
+        self._info = self.azure.info(self.path)
+        return self._info
 
     def tell(self):
         """ Current file location """
@@ -1066,27 +1409,33 @@ class AzureDLFile(object):
         if length < 0:
             length = self.size
 
-        line = b""
+        pieces = []
         while True:
 
             # if cache has last bytes of file and its read, return line and exit loop
             if self.end >= self.size and self.loc >= self.end:
-                return line
+                break
 
             self._read_blocksize()
 
-            found = self.cache[self.loc - self.start:].find(b'\n') + 1
+            # search from the current offset rather than copying the cache
+            # tail before scanning it
+            offset = self.loc - self.start
+            index = self.cache.find(b'\n', offset)
+            found = index - offset + 1 if index != -1 else 0
             if found:
-                partialLine = self.cache[
-                              self.loc - self.start: min(self.loc - self.start + found, self.loc - self.start + length)]
+                partialLine = self._cache_mv[
+                              offset: min(offset + found, offset + length)]
             else:
-                partialLine = self.cache[self.loc - self.start:]
+                partialLine = self._cache_mv[offset:]
 
             self.loc += len(partialLine)
-            line += partialLine
+            pieces.append(partialLine)
 
             if found:
-                return line
+                break
+
+        return b"".join(pieces)
 
     def __next__(self):
         out = self.readline()
@@ -1104,11 +1453,23 @@ class AzureDLFile(object):
         return list(self)
 
     def _fetch(self, start, end):
+        # The cache is always replaced wholesale, never extended or merged:
+        # growing a bytes cache would recopy the whole buffer per fetch,
+        # reads inside it are served as zero-copy memoryview slices, and the
+        # cache-window tests pin exactly which range a seek re-fetches.
         self.start = start
         self.end = min(end, self.size)
-        response = _fetch_range_with_retry(
-            self.azure.azure, self.path.as_posix(), self.start, self.end, filesessionid=self.filesessionid)
-        self.cache = getattr(response, 'content', response)
+        if (self.max_concurrency > 1
+                and self.end - self.start > _FETCH_CHUNKSIZE):
+            self.cache = _fetch_range_parallel(
+                self.azure.azure, self.path.as_posix(), self.start, self.end,
+                max_workers=self.max_concurrency,
+                filesessionid=self.filesessionid)
+        else:
+            response = _fetch_range_with_retry(
+                self.azure.azure, self.path.as_posix(), self.start, self.end, filesessionid=self.filesessionid)
+            self.cache = getattr(response, 'content', response)
+        self._cache_mv = memoryview(self.cache)
 
     def _read_blocksize(self, offset=-1):
         """
@@ -1129,6 +1490,7 @@ class AzureDLFile(object):
             self.start = self.size
             self.end = self.size
             self.cache = b""
+            self._cache_mv = memoryview(b"")
             return
         if self.start <= offset < self.end:
             logger.debug("Read offset {offset} is within cache {start}-{end}. "
@@ -1136,8 +1498,39 @@ class AzureDLFile(object):
             return
         if offset > self.size:
             raise ValueError('Read offset is outside the File')
+        if self._ahead is not None:
+            ahead_start, ahead_end, future = self._ahead
+            self._ahead = None
+            if ahead_start == offset:
+                try:
+                    response = future.result()
+                except Exception:
+                    # fall through to the synchronous fetch, which retries
+                    pass
+                else:
+                    self.start = ahead_start
+                    self.end = ahead_end
+                    self.cache = getattr(response, 'content', response)
+                    self._cache_mv = memoryview(self.cache)
+                    return
+            else:
+                # the reader seeked away; the prefetched block is stale
+                future.cancel()
         self._fetch(offset, offset + self.blocksize)
 
+    def _maybe_readahead(self):
+        """ Start prefetching the next block once past the current midpoint """
+        if (not self.readahead or self._ahead is not None
+                or self.end >= self.size
+                or self.loc - self.start <= self.blocksize // 2):
+            return
+        ahead_start = self.end
+        ahead_end = min(ahead_start + self.blocksize, self.size)
+        future = _fetch_pool().submit(
+            _fetch_range_with_retry, self.azure.azure, self.path.as_posix(),
+            ahead_start, ahead_end, filesessionid=self.filesessionid)
+        self._ahead = (ahead_start, ahead_end, future)
+
     def read(self, length=-1):
         """
         Return data from cache, or fetch pieces as necessary
@@ -1153,12 +1546,27 @@ class AzureDLFile(object):
             length = self.size
         if self.closed:
             raise ValueError('I/O operation on closed file.')
+        if self.start <= self.loc and self.loc + length <= self.end:
+            # Hot sequential path: the whole request is already cached, so
+            # skip the fetch bookkeeping and slice straight out of the cache.
+            off = self.loc - self.start
+            if off == 0 and length == len(self.cache):
+                out = self.cache
+            else:
+                out = bytes(self._cache_mv[off:off + length])
+            self.loc += length
+            self._maybe_readahead()
+            return out
         flag = 0
-        out = b""
+        # Collect the pieces and join once at the end; repeated bytes
+        # concatenation recopies everything read so far on each iteration.
+        pieces = []
         while length > 0:
             self._read_blocksize()
-            data_read = self.cache[self.loc - self.start:
-                                   min(self.loc - self.start + length, self.end - self.start)]
+            # slicing the memoryview is O(1); bytes are only materialized
+            # once, in the final join
+            data_read = self._cache_mv[self.loc - self.start:
+                                       min(self.loc - self.start + length, self.end - self.start)]
             if not data_read:  # Check to catch possible server errors. Ideally shouldn't happen.
                 flag += 1
                 if flag >= 5:
@@ -1169,13 +1577,21 @@ class AzureDLFile(object):
                     raise DatalakeIncompleteTransferException('Could not read data: {path}. '
                                                               'Repeated zero byte reads. Possible file corruption. File Details'
                                                               '{details}'.format(path=self.path, details=exception_string))
-            out += data_read
+            pieces.append(data_read)
             self.loc += len(data_read)
             length -= len(data_read)
             if self.loc >= self.size:
                 length = 0
 
-        return out
+        self._maybe_readahead()
+        if len(pieces) == 1:
+            piece = pieces[0]
+            if piece.nbytes == len(self.cache):
+                # The read spans the whole cached block; hand the immutable
+                # cache out as-is rather than copying blocksize bytes.
+                return self.cache
+            return bytes(piece)
+        return b"".join(pieces)
 
     read1 = read
 
@@ -1193,9 +1609,37 @@ class AzureDLFile(object):
         -------
         Returns number of bytes read.
         """
-        temp = self.read(len(b))
-        b[:len(temp)] = temp
-        return len(temp)
+        if self.mode != 'rb':
+            raise ValueError('File not in read mode')
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        # Copy straight from the cache view into the caller's buffer; going
+        # through read() would materialize an intermediate bytes object of
+        # the full requested length first.
+        out = memoryview(b)
+        length = len(out)
+        written = 0
+        flag = 0
+        while written < length and self.loc < self.size:
+            self._read_blocksize()
+            offset = self.loc - self.start
+            data_read = self._cache_mv[
+                offset:min(offset + length - written, self.end - self.start)]
+            if not data_read:
+                flag += 1
+                if flag >= 5:
+                    exception_string = "Current Location:{loc}, " \
+                                       "File Size:{size}, Cache Start:{start}, " \
+                                       "Cache End:{end}".format(loc=self.loc, size=self.size,
+                                                                start=self.start, end=self.end)
+                    raise DatalakeIncompleteTransferException('Could not read data: {path}. '
+                                                              'Repeated zero byte reads. Possible file corruption. File Details'
+                                                              '{details}'.format(path=self.path, details=exception_string))
+            out[written:written + len(data_read)] = data_read
+            written += len(data_read)
+            self.loc += len(data_read)
+        self._maybe_readahead()
+        return written
 
     def write(self, data):
         """
@@ -1217,13 +1661,36 @@ class AzureDLFile(object):
         # TODO Flush may be simplified
         # Buffered writes so a very large buffer is not copied leading to very large memory consumption
         bytes_written = 0
-        for i in range(0, len(data), self.blocksize):
-            out = self.buffer.write(ensure_writable(data[i:i + self.blocksize]))
+        # memoryview slices avoid materializing an intermediate bytes copy
+        # of each blocksize chunk before it lands in the buffer.
+        view = memoryview(ensure_writable(data))
+        for i in range(0, len(view), self.blocksize):
+            chunk = view[i:i + self.blocksize]
+            if (not self.delimiter and len(chunk) == self.blocksize
+                    and self.buffer.tell() == 0):
+                # Aligned full block with nothing buffered: send it straight
+                # to the writer, skipping the BytesIO round trip entirely.
+                self._submit_append(bytes(chunk), self.loc,
+                                    self._append_args())
+                self.loc += len(chunk)
+                bytes_written += len(chunk)
+                continue
+            out = self.buffer.write(chunk)
             self.loc += out
             bytes_written += out
             self.flush(syncFlag='DATA')
         return bytes_written
 
+    def _append_args(self):
+        return {
+            'rest': self.azure.azure,
+            'op': 'APPEND',
+            'path': self.path.as_posix(),
+            'append': 'true',
+            'leaseid': self.leaseid,
+            'filesessionid': self.filesessionid
+        }
+
     def flush(self, syncFlag='METADATA', force=False):
         """
         Write buffered data to ADL.
@@ -1243,38 +1710,56 @@ class AzureDLFile(object):
         if not (syncFlag == 'METADATA' or syncFlag == 'DATA' or syncFlag == 'CLOSE'):
             raise ValueError('syncFlag must be one of these: METADATA, DATA or CLOSE')
 
-        common_args_append = {
-            'rest': self.azure.azure,
-            'op': 'APPEND',
-            'path': self.path.as_posix(),
-            'append': 'true',
-            'leaseid': self.leaseid,
-            'filesessionid': self.filesessionid
-        }
+        common_args_append = self._append_args()
         self.buffer.seek(0)  # Go to start of buffer
         data = self.buffer.read()
 
-        while len(data) > self.blocksize:
+        # Walk the buffer with an index rather than re-slicing the tail on
+        # every iteration, which would copy the remainder once per block.
+        pos = 0
+        while len(data) - pos > self.blocksize:
             data_to_write_limit = self.blocksize
             if self.delimiter:
-                delimiter_index = data.rfind(self.delimiter, 0, self.blocksize)
+                delimiter_index = data.rfind(self.delimiter, pos,
+                                             pos + self.blocksize)
                 if delimiter_index != -1:  # delimiter found
-                    data_to_write_limit = delimiter_index + len(self.delimiter)
+                    data_to_write_limit = delimiter_index - pos + len(self.delimiter)
 
-            offset = self.tell() - len(data)
-            _put_data_with_retry(syncFlag='DATA', data=data[:data_to_write_limit], offset=offset, **common_args_append)
+            offset = self.tell() - (len(data) - pos)
+            self._submit_append(data[pos:pos + data_to_write_limit], offset,
+                                common_args_append)
             logger.debug('Wrote %d bytes to %s' % (data_to_write_limit, self))
-            data = data[data_to_write_limit:]
+            pos += data_to_write_limit
 
         if force:
-            offset = self.tell() - len(data)
-            _put_data_with_retry(syncFlag=syncFlag, data=data, offset=offset, **common_args_append)
-            logger.debug('Wrote %d bytes to %s' % (len(data), self))
-            data = b''
-
-        self.buffer = io.BytesIO(data)
+            # The final append carries the sync flag and must land after
+            # every block already in flight.
+            self._drain_appends()
+            remainder = data[pos:]
+            offset = self.tell() - len(remainder)
+            _put_data_with_retry(syncFlag=syncFlag, data=remainder, offset=offset, **common_args_append)
+            logger.debug('Wrote %d bytes to %s' % (len(remainder), self))
+            pos = len(data)
+
+        self.buffer = io.BytesIO(data[pos:] if pos else data)
         self.buffer.seek(0, 2)  # seek to end for other writes to buffer
 
+    # Upper bound on blocks queued behind the background writer, keeping
+    # buffered memory at a few blocks while the pipeline stays full.
+    _MAX_PENDING_APPENDS = 4
+
+    def _submit_append(self, data, offset, common_args):
+        while len(self._pending) >= self._MAX_PENDING_APPENDS:
+            self._pending.popleft().result()
+        self._pending.append(self._writer.submit(
+            _put_data_with_retry, syncFlag='DATA', data=data, offset=offset,
+            **common_args))
+
+    def _drain_appends(self):
+        """ Wait for all in-flight appends, surfacing any failure """
+        while self._pending:
+            self._pending.popleft().result()
+
     def close(self):
         """ Close file
 
@@ -1283,8 +1768,12 @@ class AzureDLFile(object):
         logger.debug("closing stream")
         if self.closed:
             return
+        if self._ahead is not None:
+            self._ahead[2].cancel()
+            self._ahead = None
         if self.writable():
             self.flush(syncFlag='CLOSE', force=True)
+            self._writer.shutdown()
             self.azure.invalidate_cache(self.path.as_posix())
         self.closed = True
 
@@ -1326,13 +1815,241 @@ def _fetch_range_with_retry(rest, path, start, end, stream=False, retries=10,
     retry_policy = ExponentialRetryPolicy(max_retries=retries, exponential_retry_interval=delay,
                                           exponential_factor=backoff)
     try:
-        return _fetch_range(rest, path, start, end, stream=False, retry_policy=retry_policy, **kwargs)
+        return _fetch_range(rest, path, start, end, stream=stream, retry_policy=retry_policy, **kwargs)
     except Exception as e:
         err = e
         exception = RuntimeError('Max number of ADL retries exceeded: exception ' + repr(err))
+        # keep the terminal error as the cause so callers can still see
+        # whether the failure was throttling, timeout or permission
+        exception.__cause__ = err
         rest.log_response_and_raise(None, exception)
 
 
+def _match_class(pat, start, end, ch):
+    """ Test ch against the character class pat[start:end] ('[...]') """
+    j = start + 1
+    negate = pat[j] == '!'
+    if negate:
+        j += 1
+    matched = False
+    body_end = end - 1
+    while j < body_end:
+        if j + 2 < body_end and pat[j + 1] == '-':
+            if pat[j] <= ch <= pat[j + 2]:
+                matched = True
+            j += 3
+        else:
+            if pat[j] == ch:
+                matched = True
+            j += 1
+    return matched != negate
+
+
+def _match_part(pat, name):
+    """ fnmatch-style match of one path component, without the regex engine
+
+    Two-pointer scan with a single backtrack point per '*'; linear in the
+    component length for typical patterns, where translated regexes can
+    backtrack combinatorially.
+    """
+    lp, ln = len(pat), len(name)
+    pi = ni = 0
+    star_pi = star_ni = -1
+    while ni < ln:
+        if pi < lp:
+            c = pat[pi]
+            if c == '*':
+                star_pi, star_ni = pi, ni
+                pi += 1
+                continue
+            if c == '?':
+                pi += 1
+                ni += 1
+                continue
+            if c == '[':
+                # scan for the closing bracket; '[' without one is literal
+                j = pi + 1
+                if j < lp and pat[j] == '!':
+                    j += 1
+                if j < lp and pat[j] == ']':
+                    j += 1
+                while j < lp and pat[j] != ']':
+                    j += 1
+                if j < lp:
+                    if _match_class(pat, pi, j + 1, name[ni]):
+                        pi = j + 1
+                        ni += 1
+                        continue
+                elif name[ni] == '[':
+                    pi += 1
+                    ni += 1
+                    continue
+            elif c == name[ni]:
+                pi += 1
+                ni += 1
+                continue
+        if star_pi != -1:
+            # retry the last '*' swallowing one more character
+            star_ni += 1
+            pi = star_pi + 1
+            ni = star_ni
+            continue
+        return False
+    while pi < lp and pat[pi] == '*':
+        pi += 1
+    return pi == lp
+
+
+@lru_cache(maxsize=1024)
+def _compile_part(part):
+    # memoized so repeated globs (and the repeated components within one
+    # pattern) compile each segment once per process
+    if not any(c in part for c in '*?['):
+        return part.__eq__
+    return lambda name: _match_part(part, name)
+
+
+@lru_cache(maxsize=1024)
+def _glob_matcher(pattern):
+    """ Compiled matcher equivalent to AzureDLPath(...).match(pattern)
+
+    Building a PurePath and re-translating the pattern for every candidate
+    makes glob quadratic-ish on big listings; each pattern component is
+    compiled once here, to a plain string compare when it holds no glob
+    characters. Like pathlib, a relative pattern matches from the right.
+    """
+    pattern_path = pathlib.PurePath(pattern)
+    if pattern_path.anchor:
+        # anchored patterns are rare; keep pathlib's exact behavior
+        return lambda p: AzureDLPath(p).match(pattern)
+    matchers = [_compile_part(part) for part in pattern_path.parts]
+    nparts = len(matchers)
+
+    def match(path):
+        parts = [part for part in str(path).split('/') if part and part != '.']
+        if nparts > len(parts):
+            return False
+        return all(m(part)
+                   for m, part in zip(matchers, parts[-nparts:]))
+
+    return match
+
+
+@lru_cache(maxsize=1024)
+def _anchored_matcher(prefix, tail):
+    """ Matcher for a pattern anchored at a literal directory head
+
+    ``glob`` matches such patterns segment by segment below the head, one
+    pattern segment per path level; this compiles the same test into a
+    single callable so ``glob_many`` can apply it during a shared walk.
+    """
+    matchers = [_compile_part(seg) for seg in tail]
+    nparts = len(matchers)
+    base = prefix + '/'
+    nbase = len(base)
+
+    def match(path):
+        name = str(path)
+        if not name.startswith(base):
+            return False
+        parts = name[nbase:].split('/')
+        if len(parts) != nparts:
+            return False
+        return all(m(part) for m, part in zip(matchers, parts))
+
+    return match
+
+
+# Sub-range size used when a single block fetch is split across parallel
+# requests; ranges at most this large go out as one request.
+_FETCH_CHUNKSIZE = 4 * 2 ** 20
+
+# Process-wide pool for ranged sub-requests, built on first use. Sharing one
+# pool spares every large read the cost of spinning threads up and down, and
+# bounds total fetch concurrency when several files stream at once.
+_FETCH_POOL_WORKERS = 16
+_fetch_pool_lock = threading.Lock()
+_fetch_pool_instance = []
+
+
+def _fetch_pool():
+    with _fetch_pool_lock:
+        if not _fetch_pool_instance:
+            _fetch_pool_instance.append(
+                ThreadPoolExecutor(_FETCH_POOL_WORKERS))
+        return _fetch_pool_instance[0]
+
+
+# Companion pool for concurrent LISTSTATUS calls during walk and glob,
+# kept separate from the data-fetch pool so heavy reads cannot starve
+# metadata traversal (or vice versa). The metadata paths are round-trip
+# bound, so this fan-out combined with the per-thread pooled sessions in
+# DatalakeRESTInterface keeps many small requests in flight over warm TLS
+# connections without requiring an async client.
+_LIST_POOL_WORKERS = 16
+_list_pool_lock = threading.Lock()
+_list_pool_instance = []
+
+
+def _list_pool():
+    with _list_pool_lock:
+        if not _list_pool_instance:
+            _list_pool_instance.append(
+                ThreadPoolExecutor(_LIST_POOL_WORKERS))
+        return _list_pool_instance[0]
+
+
+def _fetch_range_parallel(rest, path, start, end, chunksize=_FETCH_CHUNKSIZE,
+                          max_workers=16, **kwargs):
+    """ Fetch [start, end) as concurrent sub-range requests
+
+    A single GET is limited by one connection's bandwidth and spends much
+    of its time in RTT/slow-start on WAN links. Splitting the range over
+    the shared pool and writing each piece into a preallocated buffer
+    keeps multiple requests on the wire with no reassembly copies; at most
+    max_workers sub-requests per call are in flight at once.
+    """
+    buf = bytearray(end - start)
+
+    def fetch(offset):
+        sub_end = min(offset + chunksize, end)
+        pos = offset
+        flag = 0
+        while pos < sub_end:
+            response = _fetch_range_with_retry(
+                rest, path, pos, sub_end, **kwargs)
+            data = getattr(response, 'content', response)
+            if len(data) > sub_end - pos:
+                raise IOError('Received more bytes than requested from the '
+                              'server. Expected: {}. Received: {}.'.format(
+                                  sub_end - pos, len(data)))
+            if data:
+                buf[pos - start:pos - start + len(data)] = data
+                pos += len(data)
+                flag = 0
+                continue
+            # a successful response may still carry a short or empty body
+            # under throttling; re-request the remainder rather than leave
+            # a zero-filled gap in the buffer
+            flag += 1
+            if flag >= 5:
+                raise DatalakeIncompleteTransferException(
+                    'Could not read data: {path}. Repeated zero byte reads. '
+                    'Possible file corruption. Range {start}-{end}, '
+                    'offset {pos}'.format(path=path, start=offset,
+                                          end=sub_end, pos=pos))
+
+    pool = _fetch_pool()
+    pending = deque()
+    for offset in range(start, end, chunksize):
+        if len(pending) >= max_workers:
+            pending.popleft().result()
+        pending.append(pool.submit(fetch, offset))
+    while pending:
+        pending.popleft().result()
+    return bytes(buf)
+
+
 def _put_data(rest, op, path, data, retry_policy=ExponentialRetryPolicy(), **kwargs):
     logger.debug('Put: %s %s, %s', op, path, kwargs)
     return rest.call(op, path=path, data=data, retry_policy=retry_policy, **kwargs)
@@ -1364,6 +2081,7 @@ def _put_data_with_retry(rest, op, path, data, retries=10, delay=0.01, backoff=3
         logger.debug('Exception %s on ADL upload',
                      repr(err))
         exception = RuntimeError('Max number of ADL retries exceeded: exception ' + repr(err))
+        exception.__cause__ = err
         rest.log_response_and_raise(None, exception)
 
 
@@ -1418,4 +2136,8 @@ class AzureDLPath(type(pathlib.PurePath())):
 
     def trim(self):
         """ Return path without anchor (concatenation of drive and root). """
+        if not self.anchor:
+            # already relative; paths are immutable, so skip rebuilding an
+            # identical object through relative_to
+            return self
         return self.relative_to(self.anchor)
@@ -28,6 +28,13 @@ from .retry import ExponentialRetryPolicy
 import requests
 import requests.exceptions
 
+# optional fast JSON decoder; response parsing falls back to the stdlib
+# parser inside requests when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _http_cache = {}  # Useful for MSAL. https://msal-python.readthedocs.io/en/latest/#msal.PublicClientApplication.params.http_cache
 
 # this is required due to github issue, to ensure we don't lose perf from openPySSL: https://github.com/pyca/pyopenssl/issues/625
@@ -117,6 +124,10 @@ class DatalakeRESTInterface:
         'MSGETACLSTATUS': ('get', set(), set()),
         'REMOVEDEFAULTACL': ('put', set(), set())
     }
+    # Freeze the table (api-version is allowed everywhere) so call() can
+    # validate against shared immutable sets instead of mutating them.
+    ends = {op: (method, frozenset(required), frozenset(allowed) | {'api-version'})
+            for op, (method, required, allowed) in ends.items()}
 
     def __init__(self, store_name=default_store, token_credential=None, scopes=None, url_suffix=default_adls_suffix, **kwargs):
         # in the case where an empty string is passed for the url suffix, it must be replaced with the default.
@@ -125,11 +136,19 @@ class DatalakeRESTInterface:
         self.token_credential = token_credential
         self.scopes = scopes or "https://datalake.azure.net//.default"
         self.AccessToken = None
+        # Coalesces concurrent refreshes: interfaces are shared between
+        # threads, and near expiry every worker would otherwise go to the
+        # identity endpoint at once for the same token.
+        self._token_refresh_lock = threading.Lock()
 
         # There is a case where the user can opt to exclude an API version, in which case
         # the service itself decides on the API version to use (it's default).
         self.api_version = kwargs.pop('api_version', '2018-09-01')
         self.req_timeout_s = kwargs.pop('req_timeout_s', 60)
+        # Base query parameters per op, built once; call() copies the
+        # relevant dict instead of reassembling OP/api-version per request.
+        extra = {'api-version': self.api_version} if self.api_version else {}
+        self._op_params = {op: dict({'OP': op}, **extra) for op in self.ends}
 
         self.url = 'https://%s.%s/' % (store_name, url_suffix)
 
@@ -141,28 +160,60 @@ class DatalakeRESTInterface:
             __name__,
             __version__)
 
+    # Start refreshing this many seconds before expiry; while the token is
+    # still outside the hard margin, only the refreshing thread pays the
+    # identity round trip and everyone else keeps the current token.
+    _TOKEN_REFRESH_MARGIN = 300
+    _TOKEN_HARD_MARGIN = 60
+
     def get_refreshed_bearer_token(self):
-        # Check if the token is about to expire in 300 seconds and refresh it if necessary
-        if self.AccessToken is None or time.time() > self.AccessToken.expires_on - 300:
-            self.AccessToken = self.token_credential.get_token(self.scopes)
-        return self.AccessToken.token
+        token = self.AccessToken
+        if (token is not None
+                and time.time() <= token.expires_on - self._TOKEN_REFRESH_MARGIN):
+            return token.token
+        if (token is not None
+                and time.time() <= token.expires_on - self._TOKEN_HARD_MARGIN):
+            # proactive window: refresh without stalling other callers,
+            # who continue on the still-valid token
+            if self._token_refresh_lock.acquire(False):
+                try:
+                    current = self.AccessToken
+                    if (current is None or time.time() >
+                            current.expires_on - self._TOKEN_REFRESH_MARGIN):
+                        self.AccessToken = \
+                            self.token_credential.get_token(self.scopes)
+                finally:
+                    self._token_refresh_lock.release()
+            return (self.AccessToken or token).token
+        # expired or nearly so: everyone waits for one refresh
+        with self._token_refresh_lock:
+            token = self.AccessToken
+            if (token is None or time.time() >
+                    token.expires_on - self._TOKEN_HARD_MARGIN):
+                token = self.token_credential.get_token(self.scopes)
+                self.AccessToken = token
+        return token.token
 
     @property
     def session(self):
         bearer_token = self.get_refreshed_bearer_token()
-        try:
-            s = self.local.session
-            s.headers['Authorization'] = "Bearer " + bearer_token
-        except AttributeError:
-            s = None
-        if not s:
+        s = getattr(self.local, 'session', None)
+        if s is None:
             adapter = requests.adapters.HTTPAdapter(
                 pool_connections=MAX_POOL_CONNECTIONS,
                 pool_maxsize=MAX_POOL_CONNECTIONS)
             s = requests.Session()
-            s.mount(self.url, adapter)
-            s.headers['Authorization'] = "Bearer " + bearer_token
+            # Mount on the scheme rather than the account URL so pooled,
+            # kept-alive connections are also used if the service redirects
+            # within the domain.
+            s.mount('https://', adapter)
             self.local.session = s
+            self.local.bearer_token = None
+        # The session persists across token refreshes; only the header is
+        # touched, and only when the token actually rotated.
+        if self.local.bearer_token != bearer_token:
+            s.headers['Authorization'] = "Bearer " + bearer_token
+            self.local.bearer_token = bearer_token
         return s
 
     def _log_request(self, method, url, op, path, params, headers, retry_count):
@@ -212,6 +263,11 @@ class DatalakeRESTInterface:
             return False
         return response.headers['content-type'].startswith('application/json')
 
+    def _response_json(self, response):
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
     def call(self, op, path='', is_extended=False, expected_error_code=None, retry_policy=None, headers = {},  **kwargs):
         """ Execute a REST call
 
@@ -238,20 +294,18 @@ class DatalakeRESTInterface:
         if op not in self.ends:
             raise ValueError("No such op: %s", op)
         method, required, allowed = self.ends[op]
-        allowed.add('api-version')
         data = kwargs.pop('data', b'')
         stream = kwargs.pop('stream', False)
-        keys = set(kwargs)
-        if required > keys:
+        # validate against the kwargs view directly; difference sets are
+        # only materialized on the error path
+        keys = kwargs.keys()
+        if not required.issubset(keys):
             raise ValueError("Required parameters missing: %s",
-                             required - keys)
-        if keys - allowed > set():
+                             required.difference(keys))
+        if not allowed.issuperset(keys):
             raise ValueError("Extra parameters given: %s",
-                             keys - allowed)
-        params = {'OP': op}
-        if self.api_version:
-            params['api-version'] = self.api_version
-
+                             set(keys).difference(allowed))
+        params = dict(self._op_params[op])
         params.update(kwargs)
 
         if is_extended:
@@ -276,8 +330,12 @@ class DatalakeRESTInterface:
                                             path=path,
                                             headers=headers,
                                             **kwargs)
-                # Trigger download here so any errors can be retried. response.content is cached for future use.
-                temp_download = response.content
+                if not stream:
+                    # Trigger download here so any errors can be retried.
+                    # response.content is cached for future use. Streamed
+                    # responses hand the body to the caller as it arrives
+                    # instead of buffering it here first.
+                    temp_download = response.content
             except requests.exceptions.RequestException as e:
                 last_exception = e
                 response = None
@@ -302,7 +360,7 @@ class DatalakeRESTInterface:
             err = DatalakeRESTException(
                 'Data-lake REST exception: %s, %s' % (op, path))
             if self._is_json_response(response):
-                out = response.json()
+                out = self._response_json(response)
                 if 'RemoteException' in out:
                     exception = out['RemoteException']['exception']
                     if exception == 'BadOffsetException':
@@ -313,7 +371,7 @@ class DatalakeRESTInterface:
             self._log_response(response)
 
         if self._is_json_response(response):
-            out = response.json()
+            out = self._response_json(response)
             if out.get('boolean', True) is False:
                 err = DatalakeRESTException(
                     'Operation failed: %s, %s' % (op, path))
@@ -340,8 +398,14 @@ class DatalakeRESTInterface:
     def __getstate__(self):
         state = self.__dict__.copy()
         state.pop('local', None)
+        state.pop('_token_refresh_lock', None)
         return state
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.local = threading.local()
+        self._token_refresh_lock = threading.Lock()
+
 """
 Not yet implemented (or not applicable)
 https://hadoop.apache.org/docs/stable/hadoop-project-dist/hadoop-hdfs/WebHDFS.html
@@ -23,6 +23,8 @@ import time
 import errno
 import uuid
 
+import requests.exceptions
+
 from io import open
 from .core import AzureDLPath, _fetch_range
 from .exceptions import FileExistsError, FileNotFoundError
@@ -258,7 +260,7 @@ class ADLDownloader(object):
         monitor: bool [True]
             To watch and wait (block) until completion.
         """
-        def touch(self, src, dst):
+        def touch(adlfs, src, dst):
             root = os.path.dirname(dst)
             if not os.path.exists(root) and root:
                 # don't attempt to create current directory
@@ -269,8 +271,21 @@ class ADLDownloader(object):
                     if e.errno != errno.EEXIST:
                         raise
             logger.debug('Creating empty file %s', dst)
-            with open(dst, 'wb'):
-                pass
+            length = self.client._files.get((src, dst), {}).get('length', 0)
+            with open(dst, 'wb') as f:
+                if length:
+                    # Pre-size the file so the chunk workers, which all
+                    # seek/write into it concurrently, only write data
+                    # instead of racing to extend it; where supported,
+                    # reserve the extents too.
+                    f.truncate(length)
+                    if hasattr(os, 'posix_fallocate'):
+                        try:
+                            os.posix_fallocate(f.fileno(), 0, length)
+                        except OSError:
+                            # not supported by this filesystem; the
+                            # truncate above still sets the final size
+                            pass
 
         for empty_directory in self.client._adlfs._empty_dirs_to_add():
             local_rel_rpath = str(AzureDLPath(self.rpath).trim().globless_prefix)
@@ -317,20 +332,37 @@ def get_chunk(adlfs, src, dst, offset, size, buffersize, blocksize,
 
         with open(dst, 'rb+') as fout:
             fout.seek(start)
+            stream_retry_count = 0
             while start < offset+size:
-                with closing(_fetch_range(adlfs.azure, src, start=start,
-                                          end=min(start+blocksize, offset+size), stream=True,
-                                          retry_policy=retry_policy, filesessionid=filesessionid)) as response:
-                    chunk = response.content
-                    if shutdown_event and shutdown_event.is_set():
-                        return total_bytes_downloaded, None
-                    if chunk:
-                        nwritten = fout.write(chunk)
-                        if nwritten:
-                            nbytes += nwritten
-                            start += nwritten
-                        else:
-                            raise IOError("Failed to write to disk for {0} at location {1} with blocksize {2}".format(dst, start, blocksize))
+                try:
+                    with closing(_fetch_range(adlfs.azure, src, start=start,
+                                              end=min(start+blocksize, offset+size), stream=True,
+                                              retry_policy=retry_policy, filesessionid=filesessionid)) as response:
+                        # Stream the body to disk in ~1MiB pieces rather than
+                        # materializing the whole block as one bytes object;
+                        # peak memory per worker drops from blocksize to the
+                        # piece size.
+                        for chunk in response.iter_content(chunk_size=2 ** 20):
+                            if shutdown_event and shutdown_event.is_set():
+                                return total_bytes_downloaded, None
+                            if chunk:
+                                nwritten = fout.write(chunk)
+                                if nwritten:
+                                    nbytes += nwritten
+                                    start += nwritten
+                                else:
+                                    raise IOError("Failed to write to disk for {0} at location {1} with blocksize {2}".format(dst, start, blocksize))
+                except requests.exceptions.RequestException as e:
+                    # The body can still fail mid-stream after call() has
+                    # returned; call() only retries up to the response
+                    # headers. Back off and resume from the current offset
+                    # rather than failing the whole chunk on one transient
+                    # error.
+                    if not retry_policy.should_retry(None, e, stream_retry_count):
+                        raise
+                    stream_retry_count += 1
+                    logger.debug('Retrying interrupted download of %s at offset %s: %s',
+                                 src, start, repr(e))
         logger.debug('Downloaded %s bytes to %s, byte offset %s', nbytes, dst, offset)
 
         # There are certain cases where we will be throttled and recieve less than the expected amount of data.
@@ -353,6 +385,7 @@ def get_chunk(adlfs, src, dst, offset, size, buffersize, blocksize,
         err = e
         logger.debug('Exception %s on ADL download on attempt', repr(err))
         exception = RuntimeError('Max number of ADL retries exceeded: exception ' + repr(err))
+        exception.__cause__ = err
         logger.error('Download failed %s; %s', dst, repr(exception))
         return total_bytes_downloaded, exception
 
@@ -12,6 +12,7 @@ Provides implementation of different Retry Policies
 
 # standard imports
 import logging
+import random
 import sys
 import time
 from functools import wraps
@@ -32,10 +33,14 @@ class NoRetryPolicy(RetryPolicy):
 
 class ExponentialRetryPolicy(RetryPolicy):
 
-    def __init__(self, max_retries=None, exponential_retry_interval=None, exponential_factor=None):
+    def __init__(self, max_retries=None, exponential_retry_interval=None, exponential_factor=None,
+                 max_backoff_interval=None):
         self.exponential_factor = 4 if exponential_factor is None else exponential_factor
         self.max_retries = 4 if max_retries is None else max_retries
         self.exponential_retry_interval = 1 if exponential_retry_interval is None else exponential_retry_interval
+        # Ceiling on a single sleep; with 10 retries and factor 3 the raw
+        # interval would otherwise grow into minutes per attempt.
+        self.max_backoff_interval = 32 if max_backoff_interval is None else max_backoff_interval
 
     def should_retry(self, response, last_exception, retry_count):
         if retry_count >= self.max_retries:
@@ -63,7 +68,7 @@ class ExponentialRetryPolicy(RetryPolicy):
             or status_code == 408
             or status_code == 429
             or status_code == 104):
-            self.__backoff()
+            self.__backoff(self.__retry_after(response))
             return True
 
         if 100 <= status_code < 300:
@@ -71,6 +76,27 @@ class ExponentialRetryPolicy(RetryPolicy):
 
         return False
 
-    def __backoff(self):
-        time.sleep(self.exponential_retry_interval)
+    @staticmethod
+    def __retry_after(response):
+        """Seconds the server asked us to wait, or None if it didn't say."""
+        try:
+            value = response.headers.get('Retry-After')
+        except AttributeError:
+            return None
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+    def __backoff(self, retry_after=None):
+        # Jitter desynchronizes workers that were all throttled at the same
+        # moment, so they do not retry in lockstep and trip throttling again.
+        interval = min(self.exponential_retry_interval,
+                       self.max_backoff_interval) * random.uniform(0.5, 1.5)
+        if retry_after is not None:
+            # Never come back earlier than the server asked.
+            interval = max(interval, retry_after)
+        time.sleep(interval)
         self.exponential_retry_interval *= self.exponential_factor
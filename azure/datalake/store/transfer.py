@@ -138,6 +138,12 @@ class ADLTransferClient(object):
     chunksize: int [2**28]
         Number of bytes for a chunk. Large files are split into chunks. Files
         smaller than this number will always be transferred in a single thread.
+    dynamic_chunksize: bool [False]
+        If set, `chunksize` acts as an upper bound and each file is instead
+        split so that every worker thread receives about one chunk, with a
+        1MB floor. Keeps all threads busy on files smaller than
+        nthreads * chunksize without changing the layout of larger
+        transfers.
     buffersize: int [2**25]
         Number of bytes for internal buffer. This block cannot be bigger than
         a chunk and cannot be smaller than a block.
@@ -236,13 +242,15 @@ class ADLTransferClient(object):
                  chunksize=2**28, blocksize=2**25, chunked=True,
                  unique_temporary=True, delimiter=None,
                  parent=None, verbose=False, buffersize=2**25,
-                 progress_callback=None, timeout=0):
+                 progress_callback=None, timeout=0,
+                 dynamic_chunksize=False):
         self._adlfs = adlfs
         self._parent = parent
         self._transfer = transfer
         self._merge = merge
         self._nthreads = max(1, nthreads or multiprocessing.cpu_count())
         self._chunksize = chunksize
+        self._dynamic_chunksize = dynamic_chunksize
         self._buffersize = buffersize
         self._blocksize = blocksize
         self._chunked = chunked
@@ -285,8 +293,15 @@ class ADLTransferClient(object):
         else:
             tmpdir = None
 
+        chunksize = self._chunksize
+        if self._dynamic_chunksize:
+            # size chunks so every worker gets about one per file, bounded
+            # below so small files do not degrade into tiny requests
+            chunksize = max(2 ** 20, min(self._chunksize,
+                                         -(-length // self._nthreads)))
+
         # TODO: might need xrange support for py2
-        offsets = range(0, length, self._chunksize)
+        offsets = range(0, length, chunksize)
 
         # in the case of empty files, ensure that the initial offset of 0 is properly added.
         if not offsets:
@@ -304,7 +319,7 @@ class ADLTransferClient(object):
             cstates[(name, offset)] = 'pending'
             self._chunks[(name, offset)] = {
                 "parent": (src, dst),
-                "expected": min(length - offset, self._chunksize),
+                "expected": min(length - offset, chunksize),
                 "actual": 0,
                 "exception": None}
             logger.debug("Submitted %s, byte offset %d", name, offset)
@@ -483,14 +498,19 @@ class ADLTransferClient(object):
 
     @property
     def status(self):
-        c = sum([Counter([c.state for c in f.chunks]) for f in
-                 self.progress], Counter())
+        # one Counter updated in place; summing per-file Counters re-merges
+        # every key once per file
+        c = Counter()
+        for f in self.progress:
+            c.update(chunk.state for chunk in f.chunks)
         return dict(c)
 
     def run(self, nthreads=None, monitor=True, before_start=None):
+        # resolve the worker count before sizing the pool, otherwise a
+        # per-run nthreads override never takes effect
+        self._nthreads = nthreads or self._nthreads
         self._pool = ThreadPoolExecutor(self._nthreads)
         self._shutdown_event = threading.Event()
-        self._nthreads = nthreads or self._nthreads
         self._ffutures = {}
         self._cfutures = {}
 
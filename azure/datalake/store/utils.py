@@ -36,9 +36,10 @@ def ensure_writable(b):
 def write_stdout(data):
     """ Write bytes or strings to standard output
     """
-    try:
-        sys.stdout.buffer.write(data)
-    except AttributeError:
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is not None:
+        buffer.write(data)
+    else:
         sys.stdout.write(data.decode('ascii', 'replace'))
 
 
@@ -89,22 +90,22 @@ def read_block(f, offset, length, delimiter=None):
         max_record = 2**22
         if length > max_record:
             raise IndexError('Records larger than ' + str(max_record) + ' bytes are not supported. The length requested was: ' + str(length) + 'bytes')
-        # get the last index of the delimiter if it exists
-        try:
-            last_delim_index = len(bytes) -1 - bytes[::-1].index(delimiter)
+        # get the last index of the delimiter if it exists; rfind scans in
+        # place where reversing the block first would copy all of it
+        last_delim_index = bytes.rfind(delimiter)
+        if last_delim_index != -1:
             # this ensures the length includes all of the last delimiter (in the event that it is more than one character)
             length = last_delim_index + len(delimiter)
             return bytes[0:length]
-        except ValueError:
-            # TODO: Before delimters can be supported through the ADLUploader logic, the number of chunks being uploaded 
-            # needs to be visible to this method, since it needs to throw if:
-            # 1. We cannot find a delimiter in <= 4MB of data
-            # 2. If the remaining size is less than 4MB but there are multiple chunks that need to be stitched together,
-            #   since the delimiter could be split across chunks.
-            # 3. If delimiters are specified, there must be logic during segment determination that ensures all chunks
-            #   terminate at the end of a record (on a new line), even if that makes the chunk < 256MB.
-            if length >= max_record:
-                raise IndexError('No delimiter found within max record size of ' + str(max_record) + ' bytes. Transfer without specifying a delimiter (as binary) instead.')
+        # TODO: Before delimters can be supported through the ADLUploader logic, the number of chunks being uploaded
+        # needs to be visible to this method, since it needs to throw if:
+        # 1. We cannot find a delimiter in <= 4MB of data
+        # 2. If the remaining size is less than 4MB but there are multiple chunks that need to be stitched together,
+        #   since the delimiter could be split across chunks.
+        # 3. If delimiters are specified, there must be logic during segment determination that ensures all chunks
+        #   terminate at the end of a record (on a new line), even if that makes the chunk < 256MB.
+        if length >= max_record:
+            raise IndexError('No delimiter found within max record size of ' + str(max_record) + ' bytes. Transfer without specifying a delimiter (as binary) instead.')
     
     return bytes
 
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# coding=utf-8
+# --------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import fnmatch
+from collections import OrderedDict
+
+import pytest
+
+from azure.datalake.store import core
+from azure.datalake.store.core import _glob_matcher, _match_part
+from azure.datalake.store.exceptions import FileNotFoundError
+
+
+TREE = {
+    '.': [('data', 'DIRECTORY'), ('z.csv', 'FILE')],
+    'z.csv': [('', 'FILE')],
+    'data': [('a.csv', 'FILE'), ('a1', 'FILE'), ('data', 'DIRECTORY'),
+             ('sub', 'DIRECTORY')],
+    'data/data': [('e.csv', 'FILE')],
+    'data/sub': [('x1', 'FILE'), ('x2', 'FILE'), ('deep', 'DIRECTORY')],
+    'data/sub/deep': [('x3.csv', 'FILE')],
+}
+
+
+class ListingRecorder(object):
+    """ Offline LISTSTATUS stub serving a static tree """
+    def __init__(self, tree):
+        self.tree = tree
+        self.listed = []
+
+    def call(self, op, path='', **kwargs):
+        assert op == 'LISTSTATUS'
+        self.listed.append(path)
+        if path not in self.tree:
+            raise FileNotFoundError(path)
+        statuses = [{'pathSuffix': name, 'type': type_}
+                    for name, type_ in self.tree[path]]
+        return {'FileStatuses': {'FileStatus': statuses,
+                                 'continuationToken': ''}}
+
+
+@pytest.fixture
+def fs():
+    # glob only needs listings, not credentials; build the filesystem
+    # without connecting and point it at the static tree above
+    fs = core.AzureDLFileSystem.__new__(core.AzureDLFileSystem)
+    fs.azure = ListingRecorder(TREE)
+    fs.dirs = OrderedDict()
+    fs._dirs_stamp = {}
+    fs._dirs_index = {}
+    fs._emptyDirs = []
+    fs.cache_ttl = None
+    fs.listing_cache_size = None
+    return fs
+
+
+PATTERNS = [
+    'data/*.csv',     # literal head, glob tail
+    'data/a?',        # literal head, '?' wildcard
+    'data/*/*',       # two glob levels below the head
+    'data/*/deep/*',  # literal segment between glob segments
+    'data/sub',       # glob-less: whole subtree
+    'z.csv',          # glob-less single file
+    '*.csv',          # headless: matches from the right at any depth
+    'data/q*',        # no matches
+]
+
+
+def test_glob_many_matches_glob(fs):
+    for pattern in PATTERNS:
+        expected = sorted(fs.glob(pattern, invalidate_cache=False))
+        result = sorted(fs.glob_many([pattern], invalidate_cache=False))
+        assert result == expected, pattern
+
+
+def test_glob_many_literal_head_is_anchored(fs):
+    # 'data/*.csv' must not match 'data/data/e.csv' just because its last
+    # two segments fit the pattern
+    assert fs.glob_many(['data/*.csv'], invalidate_cache=False) == \
+        ['data/a.csv']
+
+
+def test_glob_many_union(fs):
+    expected = sorted(set(fs.glob('data/*.csv', invalidate_cache=False)) |
+                      set(fs.glob('*.csv', invalidate_cache=False)))
+    result = sorted(fs.glob_many(['data/*.csv', '*.csv'],
+                                 invalidate_cache=False))
+    assert result == expected
+
+
+def test_glob_many_empty(fs):
+    assert fs.glob_many([]) == []
+
+
+def test_match_part_against_fnmatch():
+    patterns = ['abc', 'a*c', 'a*', '*', '?', 'a?c', '[abc]x', '[a-c]x',
+                '[!abc]x', '[!a-c]x', '[]]', '[!]]', 'a[bc', '[a-]x',
+                '[-c]x', 'a[b-d]*[x-z]', '*a*b*', '[?]x', '[*]x']
+    names = ['abc', 'abd', 'ac', 'a', '', 'ax', 'bx', 'cx', 'dx', '-x',
+             ']', 'b', 'a[bc', 'abz', 'aby', '?x', '*x', 'xaxbx']
+    for pat in patterns:
+        for name in names:
+            assert _match_part(pat, name) == fnmatch.fnmatchcase(name, pat), \
+                (pat, name)
+
+
+def test_match_part_unterminated_bracket():
+    # '[' with no closing ']' is a literal, as in fnmatch
+    assert _match_part('a[bc', 'a[bc')
+    assert not _match_part('a[bc', 'ab')
+    assert not _match_part('a[bc', 'abc')
+
+
+def test_glob_matcher_right_anchored():
+    match = _glob_matcher('b/*.csv')
+    assert match('b/c.csv')
+    assert match('a/b/c.csv')
+    assert not match('c.csv')
+    assert not match('a/bb/c.csv')
+    assert not match('b/sub/c.csv')
+
+
+def test_glob_literal_head_prunes_listings(fs):
+    assert fs.glob('data/*.csv', invalidate_cache=False) == ['data/a.csv']
+    # only the head is listed; the non-matching subtrees are never walked
+    assert fs.azure.listed == ['data']
+
+
+def test_glob_suffix_fast_path(fs):
+    assert sorted(fs.glob('*.csv', invalidate_cache=False)) == \
+        ['data/a.csv', 'data/data/e.csv', 'data/sub/deep/x3.csv', 'z.csv']
+
+
+def test_glob_missing_prefix_raises(fs):
+    with pytest.raises(FileNotFoundError):
+        fs.glob('nope/*', invalidate_cache=False)
+
+
+def test_glob_file_used_as_directory(fs):
+    # listing a file returns the file itself; it is not a child
+    assert fs.glob('z.csv/*', invalidate_cache=False) == []